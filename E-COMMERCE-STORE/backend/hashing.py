@@ -1,8 +1,24 @@
 # backend/hashing.py
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+load_dotenv()
+# bcrypt cost for new hashes; stored hashes with any other cost are re-hashed on the next successful login
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "10"))
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__default_rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS, bcrypt__max_rounds=BCRYPT_ROUNDS
+)
+
+# Dedicated pool for bcrypt work. The native binding releases the GIL while hashing,
+# so threads run in parallel without process-pool start-up and pickling costs.
+BCRYPT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt")
+# Jobs pending beyond this are refused so a login burst can't build an unbounded backlog
+BCRYPT_MAX_PENDING = 500
 
 class Hash:
     @staticmethod
@@ -10,5 +26,6 @@ class Hash:
         return pwd_context.hash(password)
 
     @staticmethod
-    def verify(hashed_password: str, plain_password: str):
-        return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    def verify_and_update(hashed_password: str, plain_password: str):
+        # Returns (valid, new_hash); new_hash is set when the stored hash uses outdated settings
+        return pwd_context.verify_and_update(plain_password, hashed_password)
\ No newline at end of file
@@ -0,0 +1,33 @@
+# backend/indexes.py
+
+import asyncio
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+
+
+async def ensure_indexes(db):
+    # create_index is a no-op for indexes that already exist, so this is safe to run on every startup
+    await asyncio.gather(
+        db.products.create_indexes([
+            IndexModel([("id", ASCENDING)], unique=True),
+            IndexModel([("category", ASCENDING), ("price", ASCENDING)]),
+            IndexModel([("name", ASCENDING)]),
+            IndexModel([("name", TEXT), ("description", TEXT)]),
+            IndexModel([("name_lower", ASCENDING)]),
+            IndexModel([("description_lower", ASCENDING)]),
+        ]),
+        db.customers.create_index([("email", ASCENDING)], unique=True),
+        db.admin_users.create_index([("username", ASCENDING)], unique=True),
+        db.orders.create_indexes([
+            IndexModel([("id", ASCENDING)], unique=True),
+            IndexModel([("customer_email", ASCENDING), ("created_at", DESCENDING)]),
+        ]),
+        db.categories.create_indexes([
+            IndexModel([("id", ASCENDING)], unique=True),
+            IndexModel([("name", ASCENDING)], unique=True),
+        ]),
+        db.banners.create_indexes([
+            IndexModel([("id", ASCENDING)], unique=True),
+            IndexModel([("title", ASCENDING)]),
+            IndexModel([("is_active", ASCENDING), ("created_at", DESCENDING)]),
+        ]),
+    )
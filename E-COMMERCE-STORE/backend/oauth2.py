@@ -1,8 +1,11 @@
 # backend/oauth2.py
 
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+import jwt
+from cachetools import TTLCache
 import os
+import time
+import hashlib
 from dotenv import load_dotenv
 from datetime import datetime, timedelta, timezone
 from typing import Optional
@@ -22,25 +25,41 @@ if not SECRET_KEY or len(SECRET_KEY) < 32:
     )
     SECRET_KEY = os.urandom(64).hex()
 
+# Encoded once so jwt.encode/decode don't re-encode the key on every call
+_SECRET_BYTES = SECRET_KEY.encode("utf-8")
+_ALGORITHMS = (ALGORITHM,)
+_DECODE_OPTIONS = {"require": ["exp", "sub"]}
+
 # OAuth2 schemes for admin and customer flows
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/admin/login")  # For admin
 customer_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/login")  # For customer
 
+# Recently verified tokens, keyed by a digest of the raw token so it is never stored.
+# Each entry holds (subject, exp); only successfully decoded tokens are cached.
+_verified_tokens = TTLCache(maxsize=10_000, ttl=60)
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire, "iat": datetime.now(timezone.utc)})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SECRET_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
 
 
 def verify_token(token: str, credentials_exception):
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _verified_tokens.get(cache_key)
+    if cached is not None:
+        username, expires_at = cached
+        if expires_at > time.time():
+            return username
+        _verified_tokens.pop(cache_key, None)
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        return username
-    except JWTError:
-        raise credentials_exception
\ No newline at end of file
+        # Tokens without sub or exp are rejected by PyJWT itself, before any claim is read
+        payload = jwt.decode(token, _SECRET_BYTES, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS)
+    except jwt.InvalidTokenError:
+        raise credentials_exception
+    username: str = payload["sub"]
+    _verified_tokens[cache_key] = (username, payload["exp"])
+    return username
\ No newline at end of file
@@ -1,28 +1,40 @@
 # --- Basic Imports ---
 import os
+import asyncio
+import re
+import time
 import uuid
+import hashlib
 import logging
 from pathlib import Path
-from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import Annotated, List, Optional
 
 # --- FastAPI and Related Imports ---
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, UploadFile, File, Form
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Request, Response, status, UploadFile, File, Form
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordRequestForm
 
 # --- Database Imports ---
 from motor.motor_asyncio import AsyncIOMotorClient
-from pydantic import BaseModel, Field, EmailStr
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 
 # --- Third-party Library Imports ---
 from dotenv import load_dotenv
+from cachetools import TTLCache
+import httpx
+import orjson
 import cloudinary
-import cloudinary.uploader
+import cloudinary.utils
 
 # --- Local App Imports ---
-from hashing import Hash
+from hashing import Hash, BCRYPT_POOL, BCRYPT_MAX_PENDING
+from indexes import ensure_indexes
 import oauth2
 
 # --- Initial Configuration ---
@@ -37,179 +49,395 @@ cloudinary.config(
 
 mongo_url = os.environ.get('MONGO_URL')
 db_name = os.environ.get('DB_NAME')
-client = AsyncIOMotorClient(mongo_url)
+# Bounded pool with wire compression; zlib is the fallback when zstandard isn't installed
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', '50')),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', '10')),
+    maxIdleTimeMS=60000, serverSelectionTimeoutMS=2000, compressors="zstd,zlib"
+)
 db = client[db_name]
 
-app = FastAPI(title="E-Commerce API", version="1.7.0")
+app = FastAPI(title="E-Commerce API", version="1.7.0", default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 
 
 #=================================================================
 # Pydantic Models
 #=================================================================
+def new_id() -> str:
+    return uuid.uuid4().hex
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
 class Product(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4())); name: str; description: str; price: float; category: str; image_url: str; stock: int = 0; created_at: datetime = Field(default_factory=datetime.utcnow)
+    id: str = Field(default_factory=new_id); name: str; description: str; price: float; category: str; image_url: str; stock: int = 0; created_at: datetime = Field(default_factory=utcnow)
 class Category(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4())); name: str; description: str
+    id: str = Field(default_factory=new_id); name: str; description: str
 class CategoryCreate(BaseModel):
     name: str; description: str
 class Customer(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4())); username: str; email: EmailStr; password_hash: str
+    id: str = Field(default_factory=new_id); username: str; email: EmailStr; password_hash: str
 class CustomerCreate(BaseModel):
     username: str; email: EmailStr; password: str
+class LoginRequest(BaseModel):
+    username: str; password: str
 class CustomerPublic(BaseModel):
     username: str; email: EmailStr
-    class Config: orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 class AdminUser(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4())); username: str; password_hash: str
+    id: str = Field(default_factory=new_id); username: str; password_hash: str
 class Order(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4())); customer_name: str; customer_email: str; customer_phone: str; customer_address: str
-    items: List; total_amount: float; order_status: str = "Placed"; payment_method: str; payment_status: str = "pending"; created_at: datetime = Field(default_factory=datetime.utcnow)
+    id: str = Field(default_factory=new_id); customer_name: str; customer_email: str; customer_phone: str; customer_address: str
+    items: List; total_amount: float; order_status: str = "Placed"; payment_method: str; payment_status: str = "pending"; created_at: datetime = Field(default_factory=utcnow)
+
+def projection_for(model) -> dict:
+    # Fetch only the fields a response model exposes, never Mongo's _id
+    return {"_id": 0, **dict.fromkeys(model.model_fields, 1)}
+
+PRODUCT_PROJECTION = projection_for(Product)
+CATEGORY_PROJECTION = projection_for(Category)
+ORDER_PROJECTION = projection_for(Order)
+
+def search_fields(name: str, description: str) -> dict:
+    # Lowercased mirrors stored alongside each product for the indexed prefix search
+    return {"name_lower": name.lower(), "description_lower": description.lower()}
 
 
 #=================================================================
 # Authentication Dependencies
 #=================================================================
+# Hash calls submitted to the bcrypt pool and not yet finished, queued or running
+bcrypt_pending = 0
+
+async def run_bcrypt(func, *args):
+    # Runs a Hash call on the bcrypt pool, shedding load with a 503 once too many are pending
+    global bcrypt_pending
+    if bcrypt_pending >= BCRYPT_MAX_PENDING:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Server busy, please retry", headers={"Retry-After": "1"})
+    bcrypt_pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(BCRYPT_POOL, func, *args)
+    finally:
+        bcrypt_pending -= 1
+
+# In-flight verifications keyed by digest of (stored hash, password), so a burst of identical
+# logins shares one bcrypt run; entries are dropped as soon as the run finishes
+_inflight_verifications: dict = {}
+MAX_INFLIGHT_VERIFICATIONS = 1024
+
+async def verify_password(password_hash: str, password: str):
+    key = hashlib.sha256(f"{password_hash}:{password}".encode()).digest()
+    task = _inflight_verifications.get(key)
+    if task is None:
+        task = asyncio.ensure_future(run_bcrypt(Hash.verify_and_update, password_hash, password))
+        if len(_inflight_verifications) < MAX_INFLIGHT_VERIFICATIONS:
+            _inflight_verifications[key] = task
+            task.add_done_callback(lambda _: _inflight_verifications.pop(key, None))
+    # shield: one caller disconnecting must not cancel the run the others are waiting on
+    return await asyncio.shield(task)
+
+# Short-lived caches of authenticated user documents, keyed by username / email
+admin_cache = TTLCache(maxsize=1024, ttl=30)
+customer_cache = TTLCache(maxsize=10_000, ttl=30)
+
 async def get_current_admin(token: str = Depends(oauth2.oauth2_scheme)):
     credentials_exception = HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin credentials")
     username = oauth2.verify_token(token, credentials_exception)
-    admin = await db.admin_users.find_one({"username": username})
-    if admin is None: raise HTTPException(status_code=401, detail="Admin user not found")
+    admin = admin_cache.get(username)
+    if admin is None:
+        admin = await db.admin_users.find_one({"username": username})
+        if admin is None: raise HTTPException(status_code=401, detail="Admin user not found")
+        admin_cache[username] = admin
     return admin
 async def get_current_customer(token: str = Depends(oauth2.customer_oauth2_scheme)):
     credentials_exception = HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
     email = oauth2.verify_token(token, credentials_exception)
-    customer = await db.customers.find_one({"email": email})
-    if customer is None: raise HTTPException(status_code=401, detail="Customer not found")
+    customer = customer_cache.get(email)
+    if customer is None:
+        customer = await db.customers.find_one({"email": email})
+        if customer is None: raise HTTPException(status_code=401, detail="Customer not found")
+        customer_cache[email] = customer
     return customer
 
+CurrentAdmin = Annotated[dict, Depends(get_current_admin)]
+CurrentCustomer = Annotated[dict, Depends(get_current_customer)]
+
+#=================================================================
+# Public Response Caching
+#=================================================================
+# Serialized list responses as (body, etag), keyed by query parameters.
+# products_cache is invalidated by every admin product write; categories only expire.
+# Both are per worker process: a write only invalidates the worker that handled it.
+products_cache = TTLCache(maxsize=256, ttl=60)
+categories_cache = TTLCache(maxsize=16, ttl=60)
+# Bumped by every product write; a cache miss only stores its result if no write landed while it queried
+products_version = 0
+
+def invalidate_products():
+    global products_version
+    products_version += 1
+    products_cache.clear()
+
+def build_cache_entry(docs: list) -> tuple:
+    # Docs are written through their models and projected to the model fields, so serialize without re-validating
+    body = orjson.dumps(docs)
+    return body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # If-None-Match may list several tags, weak (W/) or not, or be "*"
+    if not if_none_match: return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+def cached_json_response(request: Request, entry: tuple) -> Response:
+    body, etag = entry
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
 #=================================================================
 # Customer & Public Routes
 #=================================================================
+# Upper bound on a single page of any list endpoint; also the default page size
+MAX_PAGE_SIZE = 1000
+
 @api_router.post("/register", response_model=CustomerPublic, tags=["Customer Auth"])
 async def register_customer(request: CustomerCreate):
-    existing_customer = await db.customers.find_one({"email": request.email})
-    if existing_customer: raise HTTPException(status_code=400, detail="Email already registered")
-    new_customer_data = Customer(username=request.username, email=request.email, password_hash=Hash.bcrypt(request.password)).dict()
+    if await db.customers.count_documents({"email": request.email}, limit=1): raise HTTPException(status_code=400, detail="Email already registered")
+    new_customer_data = Customer(username=request.username, email=request.email, password_hash=await run_bcrypt(Hash.bcrypt, request.password)).model_dump()
     await db.customers.insert_one(new_customer_data)
     return new_customer_data
 
-@api_router.post("/login", tags=["Customer Auth"])
-async def login_customer(request: OAuth2PasswordRequestForm = Depends()):
-    customer = await db.customers.find_one({"email": request.username})
-    if not customer or not Hash.verify(customer["password_hash"], request.password): raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+async def customer_login_response(email: str, password: str) -> dict:
+    customer = await db.customers.find_one({"email": email})
+    valid, new_hash = await verify_password(customer["password_hash"], password) if customer else (False, None)
+    if not valid: raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+    if new_hash: await db.customers.update_one({"_id": customer["_id"]}, {"$set": {"password_hash": new_hash}})
     access_token = oauth2.create_access_token(data={"sub": customer["email"]})
     return {"access_token": access_token, "token_type": "bearer", "user": {"email": customer["email"], "username": customer["username"]}}
 
+@api_router.post("/login", tags=["Customer Auth"])
+async def login_customer(request: OAuth2PasswordRequestForm = Depends()):
+    return await customer_login_response(request.username, request.password)
+
+# Same login for clients that post JSON instead of a form body
+@api_router.post("/login-json", tags=["Customer Auth"])
+async def login_customer_json(request: LoginRequest):
+    return await customer_login_response(request.username, request.password)
+
 @api_router.get("/me", response_model=CustomerPublic, tags=["Customer Auth"])
-async def get_customer_me(current_customer: dict = Depends(get_current_customer)):
+async def get_customer_me(current_customer: CurrentCustomer):
     return current_customer
 
 @api_router.get("/my-orders", response_model=List[Order], tags=["Customer Profile"])
-async def get_my_orders(current_customer: dict = Depends(get_current_customer)):
-    orders = await db.orders.find({"customer_email": current_customer["email"]}).sort("created_at", -1).to_list(1000)
-    return orders
+async def get_my_orders(
+    current_customer: CurrentCustomer,
+    skip: int = Query(0, ge=0), limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+):
+    orders = await db.orders.find({"customer_email": current_customer["email"]}, ORDER_PROJECTION).sort("created_at", -1).skip(skip).limit(limit).to_list(limit)
+    # Orders are written through the Order model and projected to its fields, so skip re-validating them
+    return ORJSONResponse(orders)
 
-@api_router.get("/products", response_model=List[Product], tags=["Public"])
-async def get_products(category: Optional[str] = None, search: Optional[str] = None, sort: Optional[str] = None):
+# Searches shorter than this are ignored; a one-character prefix matches most of the catalog anyway
+MIN_SEARCH_LENGTH = 2
+# $text only matches whole words, so shorter searches fall back to an anchored prefix match on the lowercased
+# name/description mirrors, which their B-tree indexes can serve. SEARCH_PREFIX_FALLBACK=0 sends them to $text too.
+# Longer searches that $text can't match at all ("sam" for "Samsung") get the same indexed prefix match.
+MIN_TEXT_SEARCH_LENGTH = 3
+SEARCH_PREFIX_FALLBACK = os.environ.get('SEARCH_PREFIX_FALLBACK', '1') == '1'
+TEXT_SCORE_SORT = [("score", {"$meta": "textScore"})]
+
+# Supported ?sort= values; price sorts within a category are served by the (category, price) index
+PRODUCT_SORTS = {"price-asc": ("price", 1), "price-desc": ("price", -1), "name-asc": ("name", 1)}
+
+@lru_cache(maxsize=1024)
+def build_product_query(category: Optional[str], search: Optional[str]) -> tuple:
+    # Returns (filter, text_search); the filter is shared between calls, so it must not be mutated
     query = {}
     if category: query["category"] = category
-    if search: query["$or"] = [{"name": {"$regex": search, "$options": "i"}}, {"description": {"$regex": search, "$options": "i"}}]
-    cursor = db.products.find(query)
-    if sort == "price-asc": cursor = cursor.sort("price", 1)
-    elif sort == "price-desc": cursor = cursor.sort("price", -1)
-    elif sort == "name-asc": cursor = cursor.sort("name", 1)
-    products = await cursor.to_list(1000)
-    return products
+    text_search = bool(search) and (len(search) >= MIN_TEXT_SEARCH_LENGTH or not SEARCH_PREFIX_FALLBACK)
+    if text_search: query["$text"] = {"$search": search}
+    elif search: query.update(build_prefix_query(None, search))
+    return query, text_search
+
+@lru_cache(maxsize=1024)
+def build_prefix_query(category: Optional[str], search: str) -> dict:
+    query = {"category": category} if category else {}
+    prefix = {"$regex": f"^{re.escape(search.lower())}"}
+    query["$or"] = [{"name_lower": prefix}, {"description_lower": prefix}]
+    return query
+
+async def find_products(query: dict, sort: Optional[str], text_search: bool, skip: int, limit: int) -> list:
+    cursor = db.products.find(query, PRODUCT_PROJECTION)
+    # An explicit sort wins; otherwise text matches come back most relevant first
+    if sort in PRODUCT_SORTS: cursor = cursor.sort(*PRODUCT_SORTS[sort])
+    elif text_search: cursor = cursor.sort(TEXT_SCORE_SORT)
+    return await cursor.skip(skip).limit(limit).to_list(limit)
+
+@api_router.get("/products", response_model=List[Product], tags=["Public"])
+async def get_products(
+    request: Request, category: Optional[str] = None, search: Optional[str] = None, sort: Optional[str] = None,
+    skip: int = Query(0, ge=0), limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+):
+    search = search.strip() if search else None
+    if search and len(search) < MIN_SEARCH_LENGTH: search = None
+    cache_key = (category, search, sort, skip, limit)
+    entry = products_cache.get(cache_key)
+    if entry is not None: return cached_json_response(request, entry)
+    version = products_version
+    query, text_search = build_product_query(category, search)
+    products = await find_products(query, sort, text_search, skip, limit)
+    # $text only matches whole stemmed words; if it matches nothing at all, try the indexed prefix match instead
+    if text_search and SEARCH_PREFIX_FALLBACK and not products and (skip == 0 or not await db.products.count_documents(query, limit=1)):
+        products = await find_products(build_prefix_query(category, search), sort, False, skip, limit)
+    entry = build_cache_entry(products)
+    if version == products_version: products_cache[cache_key] = entry
+    return cached_json_response(request, entry)
 
 @api_router.get("/products/{product_id}", response_model=Product, tags=["Public"])
 async def get_product(product_id: str):
-    product = await db.products.find_one({"id": product_id})
+    product = await db.products.find_one({"id": product_id}, PRODUCT_PROJECTION)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    return product
+    return ORJSONResponse(product)
 
 @api_router.get("/categories", response_model=List[Category], tags=["Public"])
-async def get_categories():
-    categories = await db.categories.find().to_list(1000)
-    return categories
+async def get_categories(request: Request, skip: int = Query(0, ge=0), limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)):
+    cache_key = (skip, limit)
+    entry = categories_cache.get(cache_key)
+    if entry is None:
+        categories = await db.categories.find({}, CATEGORY_PROJECTION).skip(skip).limit(limit).to_list(limit)
+        entry = categories_cache[cache_key] = build_cache_entry(categories)
+    return cached_json_response(request, entry)
 
 #=================================================================
 # Admin Routes
 #=================================================================
+# Accepted product image types: extension -> leading magic bytes
+IMAGE_SIGNATURES = {
+    ".jpg": (b"\xff\xd8\xff",), ".jpeg": (b"\xff\xd8\xff",), ".png": (b"\x89PNG\r\n\x1a\n",),
+    ".gif": (b"GIF87a", b"GIF89a"), ".webp": (b"RIFF",),
+}
+ALL_IMAGE_SIGNATURES = tuple({sig for sigs in IMAGE_SIGNATURES.values() for sig in sigs})
+
+async def validate_image(image: UploadFile):
+    # Reject by extension before touching the body, then sniff the first bytes so renamed files fail too.
+    # A file without an extension is accepted if its bytes match any of the accepted types.
+    suffix = Path(image.filename or "").suffix.lower()
+    signatures = IMAGE_SIGNATURES.get(suffix) if suffix else ALL_IMAGE_SIGNATURES
+    if signatures is None: raise HTTPException(status_code=400, detail="Unsupported image type")
+    head = await image.read(16)
+    await image.seek(0)
+    if not head.startswith(signatures) or (head.startswith(b"RIFF") and head[8:12] != b"WEBP"):
+        detail = "File content does not match its image type" if suffix else "Unsupported image type"
+        raise HTTPException(status_code=400, detail=detail)
+
+async def upload_product_image(image: UploadFile) -> str:
+    await validate_image(image)
+    # Signed upload straight to Cloudinary's REST API over the shared keep-alive client;
+    # httpx streams image.file into the multipart body instead of buffering it
+    config = cloudinary.config()
+    params = {"folder": "techmart_products", "timestamp": int(time.time())}
+    params["signature"] = cloudinary.utils.api_sign_request(params, config.api_secret)
+    params["api_key"] = config.api_key
+    try:
+        response = await app.state.http.post(
+            cloudinary.utils.cloudinary_api_url("upload", resource_type="image"),
+            data=params, files={"file": (image.filename, image.file, image.content_type)}
+        )
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=500, detail=f"Image upload failed: {e}")
+    return response.json().get("secure_url")
+
+# Creating the first admin is opt-in and happens once at startup, never from a login request
+ADMIN_BOOTSTRAP = os.environ.get('ADMIN_BOOTSTRAP') == '1'
+INITIAL_ADMIN_USERNAME = os.environ.get('INITIAL_ADMIN_USERNAME', 'admin')
+INITIAL_ADMIN_PASSWORD = os.environ.get('INITIAL_ADMIN_PASSWORD')
+
 @api_router.post("/admin/login", tags=["Admin Auth"])
 async def login_admin(request: OAuth2PasswordRequestForm = Depends()):
     admin = await db.admin_users.find_one({"username": request.username})
     if not admin:
-        # Secure bootstrap: allow creating the first admin only if the provided credentials match env-configured bootstrap values
-        initial_username = os.environ.get('INITIAL_ADMIN_USERNAME', 'admin')
-        initial_password = os.environ.get('INITIAL_ADMIN_PASSWORD')
-        if request.username == initial_username and initial_password and request.password == initial_password:
-            hashed_password = Hash.bcrypt(request.password)
-            await db.admin_users.insert_one({'username': initial_username, 'password_hash': hashed_password})
-            admin = await db.admin_users.find_one({"username": initial_username})
-        else:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin credentials")
-    if not Hash.verify(admin["password_hash"], request.password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin credentials")
+    valid, new_hash = await verify_password(admin["password_hash"], request.password)
+    if not valid:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin credentials")
+    if new_hash:
+        await db.admin_users.update_one({"_id": admin["_id"]}, {"$set": {"password_hash": new_hash}})
     access_token = oauth2.create_access_token(data={"sub": admin["username"]})
     return {"access_token": access_token, "token_type": "bearer"}
 
 @api_router.post("/admin/products-with-image", response_model=Product, tags=["Admin: Products"])
 async def create_product_with_image(
+    current_admin: CurrentAdmin,
     name: str = Form(...), description: str = Form(...), price: float = Form(...),
-    category: str = Form(...), stock: int = Form(...), image: UploadFile = File(...),
-    current_admin: dict = Depends(get_current_admin)
+    category: str = Form(...), stock: int = Form(...), image: UploadFile = File(...)
 ):
-    try:
-        result = cloudinary.uploader.upload(image.file, folder="techmart_products")
-        image_url = result.get("secure_url")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Image upload failed: {e}")
+    image_url = await upload_product_image(image)
 
     product_data = Product(
         name=name, description=description, price=price,
         category=category, stock=stock, image_url=image_url
-    ).dict()
+    ).model_dump()
+    product_data.update(search_fields(name, description))
     
     await db.products.insert_one(product_data)
+    invalidate_products()
     return product_data
 
 @api_router.put("/admin/products-with-image/{product_id}", response_model=Product, tags=["Admin: Products"])
 async def update_product_with_image(
-    product_id: str, name: str = Form(...), description: str = Form(...),
+    product_id: str, current_admin: CurrentAdmin, name: str = Form(...), description: str = Form(...),
     price: float = Form(...), category: str = Form(...), stock: int = Form(...),
-    image: Optional[UploadFile] = File(None), current_admin: dict = Depends(get_current_admin)
+    image: Optional[UploadFile] = File(None)
 ):
-    existing_product = await db.products.find_one({"id": product_id})
-    if not existing_product:
-        raise HTTPException(status_code=404, detail="Product not found")
-
-    update_data = {"name": name, "description": description, "price": price, "category": category, "stock": stock}
-
+    update_data = {"name": name, "description": description, "price": price, "category": category, "stock": stock, **search_fields(name, description)}
     if image:
-        try:
-            result = cloudinary.uploader.upload(image.file, folder="techmart_products")
-            update_data["image_url"] = result.get("secure_url")
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Image upload failed: {e}")
-    else:
-        update_data["image_url"] = existing_product.get("image_url")
-
-    await db.products.update_one({"id": product_id}, {"$set": update_data})
-    updated_product = await db.products.find_one({"id": product_id})
+        update_data["image_url"] = await upload_product_image(image)
+
+    updated_product = await db.products.find_one_and_update(
+        {"id": product_id}, {"$set": update_data}, projection=PRODUCT_PROJECTION, return_document=ReturnDocument.AFTER
+    )
+    if not updated_product:
+        raise HTTPException(status_code=404, detail="Product not found")
+    invalidate_products()
     return updated_product
 
 @api_router.delete("/admin/products/{product_id}", tags=["Admin: Products"])
-async def delete_product(product_id: str, current_admin: dict = Depends(get_current_admin)):
+async def delete_product(product_id: str, current_admin: CurrentAdmin):
     result = await db.products.delete_one({"id": product_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Product not found")
+    invalidate_products()
     return {"status": "success", "message": "Product deleted"}
 
 # --- Final App Setup ---
 app.include_router(api_router)
 
+@app.on_event("startup")
+async def startup():
+    app.state.http = httpx.AsyncClient(http2=True, timeout=60, limits=httpx.Limits(max_keepalive_connections=20))
+    # Open the first pooled connection now rather than on the first request
+    await client.admin.command("ping")
+    await ensure_indexes(db)
+    if ADMIN_BOOTSTRAP and INITIAL_ADMIN_PASSWORD and await db.admin_users.count_documents({}, limit=1) == 0:
+        try:
+            await db.admin_users.insert_one({'username': INITIAL_ADMIN_USERNAME, 'password_hash': await run_bcrypt(Hash.bcrypt, INITIAL_ADMIN_PASSWORD)})
+        except DuplicateKeyError:
+            pass  # another worker starting at the same time created it first
+    # Backfill the lowercased search mirrors for products written before they existed
+    await db.products.update_many(
+        {"$or": [{"name_lower": {"$exists": False}}, {"description_lower": {"$exists": False}}]},
+        [{"$set": {"name_lower": {"$toLower": "$name"}, "description_lower": {"$toLower": "$description"}}}]
+    )
+
+@app.on_event("shutdown")
+async def shutdown():
+    await app.state.http.aclose()
+
 # CORS configuration: prefer explicit origins via env to avoid insecure wildcard with credentials
 raw_allowed_origins = os.environ.get('ALLOWED_ORIGINS', '').strip()
 if raw_allowed_origins:
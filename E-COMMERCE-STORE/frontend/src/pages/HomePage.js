@@ -14,11 +14,11 @@ export function HomePage() {
         const fetchHomePageData = async () => {
             try {
                 // Fetch first 8 products as features
-                const productsResponse = await axios.get(`${API}/products`);
+                const productsResponse = await axios.get(`${API}/products?limit=8`);
                 setFeaturedProducts(productsResponse.data.slice(0, 8));
 
                 // Fetch categories
-                const categoriesResponse = await axios.get(`${API}/categories`);
+                const categoriesResponse = await axios.get(`${API}/categories?limit=4`);
                 setCategories(categoriesResponse.data.slice(0, 4)); // Show first 4 categories
             } catch (error) {
                 console.error("Error fetching homepage data:", error);
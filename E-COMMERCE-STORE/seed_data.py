@@ -2,188 +2,91 @@
 import asyncio
 import sys
 import os
+import uuid
+from pathlib import Path
+from datetime import datetime, timezone
 
-# Add the backend directory to Python path
-sys.path.append('/app/backend')
+# Add the backend directory (next to this script) to Python path
+BACKEND_DIR = Path(__file__).resolve().parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
 
-import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReplaceOne
 from dotenv import load_dotenv
-import uuid
-from datetime import datetime
+import orjson
+
+from indexes import ensure_indexes
 
 # Load environment variables
-load_dotenv('/app/backend/.env')
+load_dotenv(BACKEND_DIR / ".env")
 
 # Database connection
 mongo_url = os.environ['MONGO_URL']
 db_name = os.environ['DB_NAME']
 
-async def seed_database():
-    client = AsyncIOMotorClient(mongo_url)
-    db = client[db_name]
-    
+# Categories, products and banners to seed, plus the image URLs they share; ids and timestamps are added at seed time
+SEED_DATA = orjson.loads(Path(__file__).with_name("seed_data.json").read_bytes())
+
+def with_image_url(doc):
+    # Seed entries name an image from the shared "images" table; documents without one get an empty URL
+    doc = dict(doc)
+    image = doc.pop("image", None)
+    doc["image_url"] = SEED_DATA["images"][image] if image else ""
+    return doc
+
+def seed_id(collection_name, natural_key):
+    # Deterministic id, so re-seeding keeps every document's id stable across runs
+    return uuid.uuid5(uuid.NAMESPACE_DNS, f"{collection_name}.{natural_key}").hex
+
+# Upserts per bulk_write; chunks are sent concurrently and stay well under the 16MB message limit
+SEED_BATCH_SIZE = 500
+
+async def upsert_collection(collection, docs, key, label):
+    # Replace each document matched on its natural key, inserting it if missing, so re-running is idempotent
+    ops = [ReplaceOne({key: doc[key]}, {"id": seed_id(collection.name, doc[key]), **doc}, upsert=True) for doc in docs]
+    await asyncio.gather(*(
+        collection.bulk_write(ops[i:i + SEED_BATCH_SIZE], ordered=False, bypass_document_validation=True)
+        for i in range(0, len(ops), SEED_BATCH_SIZE)
+    ))
+    print(f"✅ {label} created")
+
+async def seed_collections(db):
     print("🌱 Seeding database with sample data...")
     
-    # Create categories
-    categories = [
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Electronics",
-            "description": "Electronic gadgets and devices",
-            "image_url": "https://images.unsplash.com/photo-1603732551681-2e91159b9dc2?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NTY2NzV8MHwxfHNlYXJjaHwxfHxlbGVjdHJvbmljc3xlbnwwfHx8Ymx1ZXwxNzU0NTYwMjg4fDA&ixlib=rb-4.1.0&q=85"
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Home Appliances",
-            "description": "Kitchen and home appliances",
-            "image_url": "https://images.unsplash.com/photo-1656082352918-75e24cb6d06c?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDk1Nzd8MHwxfHNlYXJjaHwxfHxhcHBsaWFuY2VzfGVufDB8fHxibHVlfDE3NTQ1NjAyOTZ8MA&ixlib=rb-4.1.0&q=85"
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Paints",
-            "description": "Wall paints and painting supplies",
-            "image_url": ""
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Hardware",
-            "description": "Tools and hardware supplies",
-            "image_url": ""
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Sanitary",
-            "description": "Bathroom and sanitary fittings",
-            "image_url": ""
-        }
-    ]
+    # One timestamp for the whole seed, timezone-aware like the API's own created_at values
+    now = datetime.now(timezone.utc)
     
-    # Clear existing categories and insert new ones
-    await db.categories.delete_many({})
-    await db.categories.insert_many(categories)
-    print("✅ Categories created")
-    
-    # Create sample products
+    categories = [with_image_url(category) for category in SEED_DATA["categories"]]
+    # Products and banners get the seed timestamp; products also get the lowercased
+    # mirrors used by the API's short prefix search
     products = [
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Samsung Galaxy Smartphone",
-            "description": "Latest Samsung Galaxy smartphone with advanced features and camera",
-            "price": 25999.00,
-            "category": "Electronics",
-            "image_url": "https://images.unsplash.com/photo-1614860243518-c12eb2fdf66c?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NTY2NzV8MHwxfHNlYXJjaHwyfHxlbGVjdHJvbmljc3xlbnwwfHx8Ymx1ZXwxNzU0NTYwMjg4fDA&ixlib=rb-4.1.0&q=85",
-            "stock": 50,
-            "created_at": datetime.utcnow()
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Sony Wireless Headphones",
-            "description": "Premium noise-canceling wireless headphones with crystal clear sound",
-            "price": 8999.00,
-            "category": "Electronics",
-            "image_url": "https://images.unsplash.com/photo-1614860243518-c12eb2fdf66c?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NTY2NzV8MHwxfHNlYXJjaHwyfHxlbGVjdHJvbmljc3xlbnwwfHx8Ymx1ZXwxNzU0NTYwMjg4fDA&ixlib=rb-4.1.0&q=85",
-            "stock": 30,
-            "created_at": datetime.utcnow()
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Dell Laptop",
-            "description": "High-performance laptop with Intel i7 processor and 16GB RAM",
-            "price": 65999.00,
-            "category": "Electronics",
-            "image_url": "https://images.unsplash.com/photo-1603732551681-2e91159b9dc2?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NTY2NzV8MHwxfHNlYXJjaHwxfHxlbGVjdHJvbmljc3xlbnwwfHx8Ymx1ZXwxNzU0NTYwMjg4fDA&ixlib=rb-4.1.0&q=85",
-            "stock": 20,
-            "created_at": datetime.utcnow()
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "name": "LG Washing Machine",
-            "description": "Fully automatic front-load washing machine with smart features",
-            "price": 35999.00,
-            "category": "Home Appliances",
-            "image_url": "https://images.pexels.com/photos/8762342/pexels-photo-8762342.jpeg",
-            "stock": 15,
-            "created_at": datetime.utcnow()
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Microwave Oven",
-            "description": "Digital microwave oven with multiple cooking modes and timer",
-            "price": 12999.00,
-            "category": "Home Appliances",
-            "image_url": "https://images.unsplash.com/photo-1656082352918-75e24cb6d06c?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDk1Nzd8MHwxfHNlYXJjaHwxfHxhcHBsaWFuY2VzfGVufDB8fHxibHVlfDE3NTQ1NjAyOTZ8MA&ixlib=rb-4.1.0&q=85",
-            "stock": 25,
-            "created_at": datetime.utcnow()
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Asian Paints Royal",
-            "description": "Premium interior wall paint with excellent coverage and durability",
-            "price": 899.00,
-            "category": "Paints",
-            "image_url": "https://images.unsplash.com/photo-1562876782-f324b8ac8e4c?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NTY2NzV8MHwxfHNlYXJjaHw0fHxlbGVjdHJvbmljc3xlbnwwfHx8Ymx1ZXwxNzU0NTYwMjg4fDA&ixlib=rb-4.1.0&q=85",
-            "stock": 100,
-            "created_at": datetime.utcnow()
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Drill Machine Set",
-            "description": "Professional cordless drill machine with multiple bits and accessories",
-            "price": 3499.00,
-            "category": "Hardware",
-            "image_url": "https://images.unsplash.com/photo-1562876782-f324b8ac8e4c?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NTY2NzV8MHwxfHNlYXJjaHw0fHxlbGVjdHJvbmljc3xlbnwwfHx8Ymx1ZXwxNzU0NTYwMjg4fDA&ixlib=rb-4.1.0&q=85",
-            "stock": 40,
-            "created_at": datetime.utcnow()
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Premium Bathroom Faucet",
-            "description": "Modern brass bathroom faucet with ceramic disc cartridge",
-            "price": 2999.00,
-            "category": "Sanitary",
-            "image_url": "https://images.unsplash.com/photo-1603732551681-2e91159b9dc2?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NTY2NzV8MHwxfHNlYXJjaHwxfHxlbGVjdHJvbmljc3xlbnwwfHx8Ymx1ZXwxNzU0NTYwMjg4fDA&ixlib=rb-4.1.0&q=85",
-            "stock": 35,
-            "created_at": datetime.utcnow()
-        }
+        {**with_image_url(product), "created_at": now, "name_lower": product["name"].lower(), "description_lower": product["description"].lower()}
+        for product in SEED_DATA["products"]
     ]
+    banners = [{**with_image_url(banner), "created_at": now} for banner in SEED_DATA["banners"]]
     
-    # Clear existing products and insert new ones
-    await db.products.delete_many({})
-    await db.products.insert_many(products)
-    print("✅ Products created")
+    # Create the indexes first, so each natural-key upsert below is an index lookup rather than a scan
+    await ensure_indexes(db)
     
-    # Create sample banners
-    banners = [
-        {
-            "id": str(uuid.uuid4()),
-            "title": "Mega Sale - Up to 50% Off",
-            "description": "Don't miss our biggest sale of the year! Electronics and appliances at unbeatable prices.",
-            "image_url": "https://images.unsplash.com/photo-1603732551681-2e91159b9dc2?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NTY2NzV8MHwxfHNlYXJjaHwxfHxlbGVjdHJvbmljc3xlbnwwfHx8Ymx1ZXwxNzU0NTYwMjg4fDA&ixlib=rb-4.1.0&q=85",
-            "link_url": "/products?category=Electronics",
-            "is_active": True,
-            "created_at": datetime.utcnow()
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "title": "New Home Appliances Collection",
-            "description": "Upgrade your home with our latest collection of smart appliances.",
-            "image_url": "https://images.unsplash.com/photo-1656082352918-75e24cb6d06c?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDk1Nzd8MHwxfHNlYXJjaHwxfHxhcHBsaWFuY2VzfGVufDB8fHxibHVlfDE3NTQ1NjAyOTZ8MA&ixlib=rb-4.1.0&q=85",
-            "link_url": "/products?category=Home%20Appliances",
-            "is_active": True,
-            "created_at": datetime.utcnow()
-        }
-    ]
-    
-    # Clear existing banners and insert new ones
-    await db.banners.delete_many({})
-    await db.banners.insert_many(banners)
-    print("✅ Banners created")
+    # The collections are independent, so upsert them concurrently
+    await asyncio.gather(
+        upsert_collection(db.categories, categories, "name", "Categories"),
+        upsert_collection(db.products, products, "name", "Products"),
+        upsert_collection(db.banners, banners, "title", "Banners")
+    )
     
     print("\n🎉 Database seeded successfully!")
     print(f"📊 Created {len(categories)} categories, {len(products)} products, and {len(banners)} banners")
-    
-    client.close()
+
+async def seed_database():
+    # A few concurrent bulk writes need only a small pool
+    client = AsyncIOMotorClient(mongo_url, maxPoolSize=10)
+    try:
+        await seed_collections(client[db_name])
+    finally:
+        # Motor's close() is synchronous; it shuts the pool down even if seeding failed
+        client.close()
 
 if __name__ == "__main__":
-    asyncio.run(seed_database())
\ No newline at end of file
+    # Never run under asyncio debug mode, even if PYTHONASYNCIODEBUG is set in the environment
+    asyncio.run(seed_database(), debug=False)
\ No newline at end of file
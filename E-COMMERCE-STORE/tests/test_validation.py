@@ -0,0 +1,73 @@
+import asyncio
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+# server.py connects lazily, so any URL will do for importing it
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "test_database")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from server import etag_matches, validate_image  # noqa: E402
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+JPEG = b"\xff\xd8\xff\xe0" + b"\x00" * 16
+WEBP = b"RIFF\x00\x00\x00\x00WEBPVP8 " + b"\x00" * 8
+WAV = b"RIFF\x00\x00\x00\x00WAVEfmt " + b"\x00" * 8
+
+
+def validate(filename, content):
+    image = UploadFile(file=io.BytesIO(content), filename=filename)
+    asyncio.run(validate_image(image))
+    return image
+
+
+@pytest.mark.parametrize("filename, content", [
+    ("photo.png", PNG),
+    ("photo.JPG", JPEG),
+    ("photo.jpeg", JPEG),
+    ("banner.gif", b"GIF89a" + b"\x00" * 16),
+    ("banner.webp", WEBP),
+    ("noextension", PNG),
+    ("noextension", WEBP),
+])
+def test_validate_image_accepts_matching_content(filename, content):
+    image = validate(filename, content)
+    # The upload is rewound so it can still be read in full
+    assert asyncio.run(image.read()) == content
+
+
+@pytest.mark.parametrize("filename, content, detail", [
+    ("script.svg", b"<svg></svg>", "Unsupported image type"),
+    ("photo.bmp", b"BM" + b"\x00" * 16, "Unsupported image type"),
+    ("noextension", b"<svg></svg>", "Unsupported image type"),
+    ("noextension", WAV, "Unsupported image type"),
+    ("photo.png", JPEG, "File content does not match its image type"),
+    ("photo.jpg", b"<?php echo 1; ?>", "File content does not match its image type"),
+    ("sound.webp", WAV, "File content does not match its image type"),
+    ("empty.png", b"", "File content does not match its image type"),
+])
+def test_validate_image_rejects(filename, content, detail):
+    with pytest.raises(HTTPException) as exc:
+        validate(filename, content)
+    assert exc.value.status_code == 400
+    assert exc.value.detail == detail
+
+
+@pytest.mark.parametrize("header, expected", [
+    ('"abc"', True),
+    ('"xyz"', False),
+    ('"xyz", "abc"', True),
+    ('"xyz","def"', False),
+    ('W/"abc"', True),
+    ('"xyz", W/"abc"', True),
+    ("*", True),
+    ("", False),
+    (None, False),
+])
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"abc"') is expected